@@ -1,22 +1,100 @@
 """Centralized configuration management for GCP resources"""
+import codecs
+import functools
 import os
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+# Quoted .env values, optionally followed by a comment: "value" # comment
+_QUOTED_VALUE_RE = re.compile(r"""^(["'])((?:\\.|(?!\1).)*)\1\s*(?:#.*)?$""")
+
+# Escape sequences python-dotenv decodes inside double and single quotes
+_DOUBLE_QUOTE_ESCAPES = re.compile(r"""\\[\\'"abfnrtv]""")
+_SINGLE_QUOTE_ESCAPES = re.compile(r"""\\[\\']""")
+
+
+def _decode_escapes(pattern: re.Pattern, value: str) -> str:
+    """Decode backslash escapes matched by pattern (e.g. \\n -> newline)"""
+    return pattern.sub(lambda match: codecs.decode(match.group(0), 'unicode-escape'), value)
+
+
+def _parse_env_value(value: str) -> str:
+    """
+    Parse the right-hand side of a KEY=VALUE line the way python-dotenv does
+
+    Quoted values keep inner whitespace and ``#``; double quotes decode
+    ``\\n``-style escapes and single quotes only ``\\\\`` and ``\\'``.
+    Unquoted values end at an inline `` #`` comment.
+    """
+    value = value.strip()
+    match = _QUOTED_VALUE_RE.match(value)
+    if match:
+        quote, inner = match.groups()
+        escapes = _DOUBLE_QUOTE_ESCAPES if quote == '"' else _SINGLE_QUOTE_ESCAPES
+        return _decode_escapes(escapes, inner)
+    return value.split(' #', 1)[0].rstrip()
+
+
+def _load_env_fast(path: Path) -> None:
+    """
+    Load KEY=VALUE pairs from a .env file into the environment
+
+    Variables already set in the environment take precedence. Blank lines,
+    comments, an optional ``export`` prefix and quoted values are handled
+    as in python-dotenv. Variable interpolation (``${VAR}``) and multi-line
+    values are not supported.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('export '):
+                line = line[len('export '):]
+
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+
+            os.environ.setdefault(key.strip(), _parse_env_value(value))
+
+
+def _find_env_file() -> Optional[Path]:
+    """Find the nearest .env file, searching upward from this package"""
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / '.env'
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_env() -> None:
+    """Load environment variables from .env unless SKIP_DOTENV=1"""
+    if os.getenv('SKIP_DOTENV') == '1':
+        return
+
+    env_file = _find_env_file()
+    if env_file:
+        _load_env_fast(env_file)
+
+
+def _env(name: str, default: Optional[str] = None):
+    """Dataclass field whose default is read from the environment at creation time"""
+    return field(default_factory=lambda: os.getenv(name, default))
 
 
 @dataclass
 class GCPConfig:
     """Google Cloud Platform configuration"""
 
-    project_id: str = os.getenv('GCP_PROJECT_ID', '')
-    bucket_name: str = os.getenv('GCS_BUCKET', 'mobile-measurement-data')
-    dataset_id: str = os.getenv('BQ_DATASET', 'mobile_measurement')
-    region: str = os.getenv('GCP_REGION', 'us-central1')
-    service_account_path: Optional[str] = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+    project_id: str = _env('GCP_PROJECT_ID', '')
+    bucket_name: str = _env('GCS_BUCKET', 'mobile-measurement-data')
+    dataset_id: str = _env('BQ_DATASET', 'mobile_measurement')
+    region: str = _env('GCP_REGION', 'us-central1')
+    service_account_path: Optional[str] = _env('GOOGLE_APPLICATION_CREDENTIALS')
 
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -37,5 +115,15 @@ class GCPConfig:
         return f"{self.project_id}.{self.dataset_id}.{table_name}"
 
 
-# Singleton instance for easy import
-config = GCPConfig()
+@functools.lru_cache(maxsize=None)
+def get_config() -> GCPConfig:
+    """Load .env on first use and return the shared configuration instance"""
+    load_env()
+    return GCPConfig()
+
+
+def __getattr__(name: str):
+    """Keep ``from src.config import config`` working without eager loading"""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
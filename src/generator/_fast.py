@@ -0,0 +1,69 @@
+"""Optional Numba-compiled sampling kernel for the vectorized event generator"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; callers fall back to NumPy sampling
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _pick(cum: np.ndarray, u: float) -> int:
+    """Inverse-CDF lookup, capped at the last index like random.choices"""
+    idx = np.searchsorted(cum, u * cum[-1], side='right')
+    return min(idx, len(cum) - 1)
+
+
+def _draw(u, cum_et, cum_pt, cum_pl, cum_co, cost_lo, cost_hi,
+          out_et, out_pt, out_pl, out_co, out_cost):
+    """Fill the output arrays from the uniform rows of u in one fused loop"""
+    for i in range(u.shape[1]):
+        et = _pick(cum_et, u[0, i])
+        out_et[i] = et
+        out_pt[i] = _pick(cum_pt, u[1, i])
+        out_pl[i] = _pick(cum_pl, u[2, i])
+        out_co[i] = _pick(cum_co, u[3, i])
+        out_cost[i] = cost_lo[et] + (cost_hi[et] - cost_lo[et]) * u[4, i]
+
+
+if NUMBA_AVAILABLE:
+    _pick = njit(cache=True)(_pick)
+    _draw = njit(cache=True)(_draw)
+
+
+def draw_columns(
+    u: np.ndarray,
+    cum_et: np.ndarray,
+    cum_pt: np.ndarray,
+    cum_pl: np.ndarray,
+    cum_co: np.ndarray,
+    cost_lo: np.ndarray,
+    cost_hi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map uniform draws to event type, partner, platform and country indices plus raw costs
+
+    The caller draws u from its generator, so a seeded batch is the same
+    whether or not this kernel is compiled.
+
+    Args:
+        u: Array of shape (5, n) with uniforms in [0, 1), one row per column
+           (event type, partner, platform, country, cost)
+        cum_et, cum_pt, cum_pl, cum_co: Cumulative weight tables
+        cost_lo, cost_hi: Cost bounds indexed by event type
+
+    Returns:
+        Tuple of (event_type_idx, partner_idx, platform_idx, country_idx, cost)
+    """
+    n = u.shape[1]
+    out_et = np.empty(n, dtype=np.intp)
+    out_pt = np.empty(n, dtype=np.intp)
+    out_pl = np.empty(n, dtype=np.intp)
+    out_co = np.empty(n, dtype=np.intp)
+    out_cost = np.empty(n, dtype=np.float64)
+    _draw(u, cum_et, cum_pt, cum_pl, cum_co, cost_lo, cost_hi,
+          out_et, out_pt, out_pl, out_co, out_cost)
+    return out_et, out_pt, out_pl, out_co, out_cost
@@ -0,0 +1,64 @@
+"""Columnar (structure-of-arrays) container for generated MMP events"""
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, Union
+
+import numpy as np
+
+# Rows materialized per step when iterating, bounding temporary Python objects
+_ITER_CHUNK = 65_536
+
+
+@dataclass
+class EventBatch:
+    """
+    A batch of MMP events stored as one NumPy array per field
+
+    Aggregations run directly on the arrays, while iteration lazily yields
+    event dictionaries so the batch can be passed wherever a list of events
+    is expected (serialization, uploads, summaries).
+    """
+
+    event_id: np.ndarray
+    timestamp: np.ndarray
+    event_type: np.ndarray
+    partner: np.ndarray
+    cost_usd: np.ndarray
+    app_id: np.ndarray
+    campaign_id: np.ndarray
+    platform: np.ndarray
+    country_code: np.ndarray
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Get a dictionary mapping field name to its array, in schema order"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def __len__(self) -> int:
+        return len(self.event_id)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], 'EventBatch']:
+        """Get a single event dictionary, or a sliced batch sharing the arrays"""
+        if isinstance(index, slice):
+            return EventBatch(**{name: array[index] for name, array in self.columns().items()})
+        return {name: array[index].item() for name, array in self.columns().items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield one event dictionary per row with native Python values"""
+        columns = self.columns()
+        names = list(columns.keys())
+        for start in range(0, len(self), _ITER_CHUNK):
+            values = [array[start:start + _ITER_CHUNK].tolist() for array in columns.values()]
+            for row in zip(*values):
+                yield dict(zip(names, row))
+
+    def to_events(self) -> List[Dict[str, Any]]:
+        """Convert the batch into a list of event dictionaries"""
+        return list(self)
+
+    def total_cost(self) -> float:
+        """Calculate total cost across all events"""
+        return float(self.cost_usd.sum())
+
+    def value_counts(self, field_name: str) -> Dict[str, int]:
+        """Get the number of events for each distinct value of a field"""
+        values, counts = np.unique(getattr(self, field_name), return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
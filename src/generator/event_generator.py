@@ -4,81 +4,142 @@ Mobile Measurement Partner (MMP) Event Generator
 Generates synthetic mobile measurement events for testing and demonstration purposes.
 Events are generated with realistic distributions and uploaded to Google Cloud Storage.
 """
-import json
+import bisect
 import random
-import uuid
+import secrets
+import multiprocessing
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Union
 import click
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.generator import mmp_config
+from src.generator.event_batch import EventBatch
 from src.utils.gcs_uploader import GCSUploader
 from src.utils.validation import MMPEventValidator
-from src.config import config
-
-
-def generate_event(historical_days: int = 30) -> Dict[str, Any]:
+from src.utils.serialization import dumps, loads
+from src.config import get_config
+
+# Buffers handed to a single writev() call when saving the local backup
+# (two per event: the serialized JSON and its newline)
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+LOCAL_BACKUP_IOV_BATCH = _IOV_MAX if _IOV_MAX > 0 else 1024
+
+# Config tables hoisted to module globals so generate_event avoids repeated
+# mmp_config attribute lookups; *_TOTAL and *_LAST bound each bisect draw
+_EVENT_TYPES = mmp_config.EVENT_TYPES
+_EVENT_CUM = mmp_config.EVENT_CUM
+_EVENT_TOTAL = _EVENT_CUM[-1]
+_EVENT_LAST = len(_EVENT_CUM) - 1
+_PARTNERS = mmp_config.PARTNERS
+_PARTNER_CUM = mmp_config.PARTNER_CUM
+_PARTNER_TOTAL = _PARTNER_CUM[-1]
+_PARTNER_LAST = len(_PARTNER_CUM) - 1
+_PLATFORMS = mmp_config.PLATFORMS
+_PLATFORM_CUM = mmp_config.PLATFORM_CUM
+_PLATFORM_TOTAL = _PLATFORM_CUM[-1]
+_PLATFORM_LAST = len(_PLATFORM_CUM) - 1
+_COUNTRIES = mmp_config.COUNTRY_CODES
+_COUNTRY_CUM = mmp_config.COUNTRY_CUM
+_COUNTRY_TOTAL = _COUNTRY_CUM[-1]
+_COUNTRY_LAST = len(_COUNTRY_CUM) - 1
+_COST_RANGES = mmp_config.COST_RANGES
+_SAMPLE_APPS = mmp_config.SAMPLE_APPS
+_SAMPLE_CAMPAIGNS = mmp_config.SAMPLE_CAMPAIGNS
+
+# Lookup tables for the vectorized generator, built once at import time
+_EVENT_TYPE_ARR = np.array(_EVENT_TYPES)
+_PARTNER_ARR = np.array(mmp_config.PARTNERS)
+_PLATFORM_ARR = np.array(mmp_config.PLATFORMS)
+_COUNTRY_ARR = np.array(mmp_config.COUNTRY_CODES)
+_APP_ARR = np.array(mmp_config.SAMPLE_APPS)
+_CAMPAIGN_ARR = np.array(mmp_config.SAMPLE_CAMPAIGNS)
+
+# Cost bounds indexed by position in _EVENT_TYPE_ARR
+_COST_LO = np.array([mmp_config.COST_RANGES[et][0] for et in _EVENT_TYPE_ARR])
+_COST_HI = np.array([mmp_config.COST_RANGES[et][1] for et in _EVENT_TYPE_ARR])
+
+# Cumulative weight tables shared by the NumPy and Numba samplers
+_EVENT_CUM_ARR = np.array(_EVENT_CUM)
+_PARTNER_CUM_ARR = np.array(_PARTNER_CUM)
+_PLATFORM_CUM_ARR = np.array(_PLATFORM_CUM)
+_COUNTRY_CUM_ARR = np.array(_COUNTRY_CUM)
+
+# Batches at or above this size use the Numba kernel when it is installed,
+# so its one-off compile/cache load is never paid for small batches
+NUMBA_MIN_EVENTS = 100_000
+
+# Minimum events per generation worker; smaller batches skip the process
+# pool, whose startup would dominate
+PARALLEL_GENERATION_THRESHOLD = 100_000
+
+
+def generate_event(
+    historical_days: int = 30,
+    _random=random.random,
+    _bisect=bisect.bisect,
+    _uniform=random.uniform,
+    _randint=random.randint,
+    _choice=random.choice,
+    _token_hex=secrets.token_hex
+) -> Dict[str, Any]:
     """
     Generate a single synthetic MMP event with realistic distributions
 
+    The underscore-prefixed arguments bind hot-loop callables as fast locals
+    and are not meant to be passed by callers.
+
     Args:
         historical_days: Generate timestamp within past N days
 
     Returns:
         Dictionary containing event data
     """
-    # Randomly select event type based on probabilities
-    event_type = random.choices(
-        list(mmp_config.EVENT_PROBABILITIES.keys()),
-        weights=list(mmp_config.EVENT_PROBABILITIES.values()),
-        k=1
-    )[0]
+    # Randomly select event type based on probabilities. Scaling by the
+    # cumulative total and capping at the final index mirrors random.choices.
+    event_type = _EVENT_TYPES[_bisect(_EVENT_CUM, _random() * _EVENT_TOTAL, 0, _EVENT_LAST)]
 
     # Select partner based on market share weights
-    partner = random.choices(
-        mmp_config.PARTNERS,
-        weights=mmp_config.PARTNER_WEIGHTS,
-        k=1
-    )[0]
+    partner = _PARTNERS[_bisect(_PARTNER_CUM, _random() * _PARTNER_TOTAL, 0, _PARTNER_LAST)]
 
     # Select platform
-    platform = random.choices(
-        mmp_config.PLATFORMS,
-        weights=mmp_config.PLATFORM_WEIGHTS,
-        k=1
-    )[0]
+    platform = _PLATFORMS[_bisect(_PLATFORM_CUM, _random() * _PLATFORM_TOTAL, 0, _PLATFORM_LAST)]
 
     # Select country
-    country = random.choices(
-        mmp_config.COUNTRY_CODES,
-        weights=mmp_config.COUNTRY_WEIGHTS,
-        k=1
-    )[0]
+    country = _COUNTRIES[_bisect(_COUNTRY_CUM, _random() * _COUNTRY_TOTAL, 0, _COUNTRY_LAST)]
 
     # Generate cost based on event type
-    cost_min, cost_max = mmp_config.COST_RANGES[event_type]
-    cost_usd = round(random.uniform(cost_min, cost_max), 2)
+    cost_min, cost_max = _COST_RANGES[event_type]
+    cost_usd = round(_uniform(cost_min, cost_max), 2)
 
     # Generate timestamp (random time within past N days)
-    now = datetime.utcnow()
-    random_seconds = random.randint(0, historical_days * 24 * 60 * 60)
-    event_time = now - timedelta(seconds=random_seconds)
-    timestamp = event_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+    # using integer epoch math and int formatting rather than datetime.strftime
+    random_seconds = _randint(0, historical_days * 24 * 60 * 60)
+    t = time.gmtime(int(time.time()) - random_seconds)
+    timestamp = (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
 
     # Create event
     event = {
-        'event_id': str(uuid.uuid4()),
+        'event_id': _token_hex(16),
         'timestamp': timestamp,
         'event_type': event_type,
         'partner': partner,
         'cost_usd': cost_usd,
-        'app_id': random.choice(mmp_config.SAMPLE_APPS),
-        'campaign_id': random.choice(mmp_config.SAMPLE_CAMPAIGNS),
+        'app_id': _choice(_SAMPLE_APPS),
+        'campaign_id': _choice(_SAMPLE_CAMPAIGNS),
         'platform': platform,
         'country_code': country
     }
@@ -101,81 +162,312 @@ def generate_batch(num_events: int, historical_days: int = 30) -> List[Dict[str,
 
     print(f"Generating {num_events} mobile measurement events...")
 
+    progress_every = max(10, num_events // 10)
     for i in range(num_events):
         event = generate_event(historical_days)
         events.append(event)
 
-        # Progress indicator
-        if (i + 1) % 10 == 0 or (i + 1) == num_events:
+        # Progress indicator (at most ~10 lines, however large the batch)
+        if (i + 1) % progress_every == 0 or (i + 1) == num_events:
             print(f"  Progress: {i + 1}/{num_events} events generated")
 
     return events
 
 
-def save_local_backup(events: List[Dict[str, Any]], output_file: str) -> None:
+def generate_columns(
+    num_events: int,
+    historical_days: int = 30,
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
     """
-    Save events to local file as backup
+    Generate a batch of MMP events as one NumPy array per field
+
+    Produces the same distributions as generate_batch, but draws every
+    column in a single call instead of looping over generate_event.
 
     Args:
-        events: List of event dictionaries
-        output_file: Path to output file
+        num_events: Number of events to generate
+        historical_days: Generate timestamps within past N days
+        seed: Optional seed for reproducible batches
+
+    Returns:
+        Dictionary mapping field name to an array of num_events values
     """
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    print(f"Generating {num_events} mobile measurement events...")
+    columns = _sample_columns(num_events, historical_days, seed)
+    print(f"  Progress: {num_events}/{num_events} events generated")
+    return columns
 
-    # Write as JSONL
-    with open(output_file, 'w') as f:
-        for event in events:
-            f.write(json.dumps(event) + '\n')
 
-    print(f"✓ Local backup saved: {output_file}")
+def generate_columns_parallel(
+    num_events: int,
+    historical_days: int = 30,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Generate a columnar batch of MMP events across multiple processes
 
+    The batch is split into one contiguous chunk per worker. Each worker
+    samples with its own independent stream spawned from a single
+    SeedSequence, so chunks are uncorrelated and a seeded run is
+    reproducible for a given worker count. Workers are capped so each
+    chunk holds at least PARALLEL_GENERATION_THRESHOLD events; when that
+    leaves a single worker the batch is generated in-process.
 
-def print_event_summary(events: List[Dict[str, Any]]) -> None:
-    """Print summary statistics of generated events"""
-    distribution = MMPEventValidator.get_event_distribution(events)
-    total_cost = MMPEventValidator.calculate_total_cost(events)
+    Args:
+        num_events: Number of events to generate
+        historical_days: Generate timestamps within past N days
+        seed: Optional seed for reproducible batches
+        workers: Maximum number of worker processes (default: CPU count)
 
-    print("\n" + "="*60)
-    print("EVENT GENERATION SUMMARY")
-    print("="*60)
+    Returns:
+        Dictionary mapping field name to an array of num_events values
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, num_events // max(PARALLEL_GENERATION_THRESHOLD, 1)))
+    if workers == 1:
+        return generate_columns(num_events, historical_days, seed)
+
+    print(f"Generating {num_events} mobile measurement events ({workers} workers)...")
+
+    streams = np.random.SeedSequence(seed).spawn(workers)
+    base, extra = divmod(num_events, workers)
+    tasks = [
+        (base + (1 if i < extra else 0), historical_days, stream)
+        for i, stream in enumerate(streams)
+    ]
+
+    with multiprocessing.Pool(workers) as pool:
+        chunks = pool.starmap(_sample_columns, tasks)
+
+    columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+    print(f"  Progress: {num_events}/{num_events} events generated")
+    return columns
+
+
+def _pick_indices(cum: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Vectorized inverse-CDF lookup matching _fast._pick"""
+    idx = np.searchsorted(cum, u * cum[-1], side='right')
+    return np.minimum(idx, len(cum) - 1)
+
+
+def _sample_columns(num_events: int, historical_days: int, seed: Any) -> Dict[str, np.ndarray]:
+    """Draw every event column; seed may be an int, SeedSequence or None"""
+    rng = np.random.default_rng(seed)
+    n = num_events
+
+    # Sample weighted categorical indices and the cost for each event type
+    # from one block of uniforms, mapped in a fused compiled loop when Numba
+    # is available. Both paths consume the same draws, so a seeded batch does
+    # not depend on whether Numba is installed.
+    u = rng.random((5, n))
+    _fast = None
+    if n >= NUMBA_MIN_EVENTS:
+        from src.generator import _fast
+    if _fast is not None and _fast.NUMBA_AVAILABLE:
+        et_idx, pt_idx, pl_idx, co_idx, costs = _fast.draw_columns(
+            u,
+            _EVENT_CUM_ARR, _PARTNER_CUM_ARR, _PLATFORM_CUM_ARR, _COUNTRY_CUM_ARR,
+            _COST_LO, _COST_HI
+        )
+    else:
+        et_idx = _pick_indices(_EVENT_CUM_ARR, u[0])
+        pt_idx = _pick_indices(_PARTNER_CUM_ARR, u[1])
+        pl_idx = _pick_indices(_PLATFORM_CUM_ARR, u[2])
+        co_idx = _pick_indices(_COUNTRY_CUM_ARR, u[3])
+        costs = _COST_LO[et_idx] + (_COST_HI[et_idx] - _COST_LO[et_idx]) * u[4]
+    costs = np.round(costs, 2)
+
+    # Sample uniformly distributed apps and campaigns
+    apps = rng.choice(_APP_ARR, size=n)
+    campaigns = rng.choice(_CAMPAIGN_ARR, size=n)
+
+    # Generate timestamps (random time within past N days)
+    now = np.datetime64('now', 's')
+    offsets = rng.integers(0, historical_days * 24 * 60 * 60, size=n, endpoint=True)
+    timestamps = np.char.add(
+        np.datetime_as_string(now - offsets.astype('timedelta64[s]'), unit='s'),
+        'Z'
+    )
+
+    # Random 128-bit hex event IDs, drawn in one os.urandom call. These come
+    # from the OS rather than rng so seeded batches still get unique IDs.
+    event_ids = np.frombuffer(os.urandom(16 * n).hex().encode('ascii'), dtype='S32').astype('U32')
+
+    columns = {
+        'event_id': event_ids,
+        'timestamp': timestamps,
+        'event_type': _EVENT_TYPE_ARR[et_idx],
+        'partner': _PARTNER_ARR[pt_idx],
+        'cost_usd': costs,
+        'app_id': apps,
+        'campaign_id': campaigns,
+        'platform': _PLATFORM_ARR[pl_idx],
+        'country_code': _COUNTRY_ARR[co_idx]
+    }
 
-    print(f"\nTotal Events: {len(events)}")
+    return columns
 
-    print("\nEvent Type Distribution:")
-    for event_type in sorted(distribution.keys()):
-        count = distribution[event_type]
-        percentage = (count / len(events)) * 100
-        print(f"  {event_type:12s}: {count:3d} events ({percentage:5.1f}%)")
 
-    print(f"\nTotal Cost: ${total_cost:,.2f}")
-    print(f"Average Cost per Event: ${total_cost/len(events):.2f}")
+def columns_to_events(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Convert columnar event data into a list of event dictionaries
 
-    # Partner distribution
-    partner_dist = {}
-    for event in events:
-        partner = event['partner']
-        partner_dist[partner] = partner_dist.get(partner, 0) + 1
+    Args:
+        columns: Dictionary mapping field name to an array of values
 
-    print("\nPartner Distribution:")
-    for partner in sorted(partner_dist.keys()):
-        count = partner_dist[partner]
-        percentage = (count / len(events)) * 100
-        print(f"  {partner:12s}: {count:3d} events ({percentage:5.1f}%)")
+    Returns:
+        List of event dictionaries with native Python values
+    """
+    return EventBatch(**columns).to_events()
 
-    # Platform distribution
-    platform_dist = {}
-    for event in events:
-        platform = event['platform']
-        platform_dist[platform] = platform_dist.get(platform, 0) + 1
 
-    print("\nPlatform Distribution:")
-    for platform in sorted(platform_dist.keys()):
-        count = platform_dist[platform]
-        percentage = (count / len(events)) * 100
-        print(f"  {platform:12s}: {count:3d} events ({percentage:5.1f}%)")
+def generate_batch_vectorized(
+    num_events: int,
+    historical_days: int = 30,
+    seed: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate a batch of MMP events using bulk NumPy sampling
 
-    print("="*60 + "\n")
+    Args:
+        num_events: Number of events to generate
+        historical_days: Generate timestamps within past N days
+        seed: Optional seed for reproducible batches
+
+    Returns:
+        List of event dictionaries
+    """
+    return columns_to_events(generate_columns(num_events, historical_days, seed))
+
+
+def generate_batch_soa(
+    num_events: int,
+    historical_days: int = 30,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None
+) -> EventBatch:
+    """
+    Generate a batch of MMP events in columnar (structure-of-arrays) form
+
+    Args:
+        num_events: Number of events to generate
+        historical_days: Generate timestamps within past N days
+        seed: Optional seed for reproducible batches
+        workers: Number of worker processes for large batches (default: CPU count)
+
+    Returns:
+        EventBatch holding one array per event field
+    """
+    return EventBatch(**generate_columns_parallel(num_events, historical_days, seed, workers))
+
+
+def save_local_backup(events: Union[List[Dict[str, Any]], EventBatch], output_file: str) -> None:
+    """
+    Save events to local file as backup
+
+    Args:
+        events: List of event dictionaries or an EventBatch
+        output_file: Path to output file
+    """
+    # Ensure directory exists
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+    # Write as JSONL. Serialized events are grouped into batches of buffers,
+    # and each batch reaches the kernel in one writev() scatter-gather call,
+    # falling back to one joined write per batch where writev is unavailable
+    if hasattr(os, 'writev'):
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            for parts in _serialized_batches(events):
+                _writev_all(fd, parts)
+        finally:
+            os.close(fd)
+    else:
+        with open(output_file, 'wb') as f:
+            for parts in _serialized_batches(events):
+                f.write(b''.join(parts))
+
+    print(f"✓ Local backup saved: {output_file}")
+
+
+def _serialized_batches(events: Union[List[Dict[str, Any]], EventBatch]) -> Iterator[List[bytes]]:
+    """Yield serialized JSONL lines in lists of at most LOCAL_BACKUP_IOV_BATCH buffers"""
+    parts = []
+    extend = parts.extend
+    for event in events:
+        extend((dumps(event), b'\n'))
+        if len(parts) >= LOCAL_BACKUP_IOV_BATCH:
+            yield parts
+            parts = []
+            extend = parts.extend
+    if parts:
+        yield parts
+
+
+def _writev_all(fd: int, parts: List[bytes]) -> None:
+    """writev() a list of buffers, finishing any short write with os.write"""
+    written = os.writev(fd, parts)
+    total = sum(map(len, parts))
+    if written < total:
+        remainder = memoryview(b''.join(parts))[written:]
+        while remainder:
+            remainder = remainder[os.write(fd, remainder):]
+
+
+def print_event_summary(events: Union[List[Dict[str, Any]], EventBatch]) -> None:
+    """Print summary statistics of generated events"""
+    if isinstance(events, EventBatch):
+        # Columnar batches aggregate directly on their arrays
+        distribution = Counter(events.value_counts('event_type'))
+        partner_dist = Counter(events.value_counts('partner'))
+        platform_dist = Counter(events.value_counts('platform'))
+        total_cost = events.total_cost()
+    else:
+        # Gather all distributions and the total cost in a single pass
+        distribution = Counter()
+        partner_dist = Counter()
+        platform_dist = Counter()
+        total_cost = 0.0
+        for event in events:
+            distribution[event['event_type']] += 1
+            partner_dist[event['partner']] += 1
+            platform_dist[event['platform']] += 1
+            total_cost += float(event['cost_usd'])
+
+    inv_n = 100.0 / len(events)
+
+    def distribution_lines(dist: Counter) -> List[str]:
+        return [
+            f"  {name:12s}: {count:3d} events ({count * inv_n:5.1f}%)"
+            for name, count in sorted(dist.items())
+        ]
+
+    # Assemble the whole report and write it in one print call
+    lines = [
+        "",
+        "="*60,
+        "EVENT GENERATION SUMMARY",
+        "="*60,
+        "",
+        f"Total Events: {len(events)}",
+        "",
+        "Event Type Distribution:",
+        *distribution_lines(distribution),
+        "",
+        f"Total Cost: ${total_cost:,.2f}",
+        f"Average Cost per Event: ${total_cost/len(events):.2f}",
+        "",
+        "Partner Distribution:",
+        *distribution_lines(partner_dist),
+        "",
+        "Platform Distribution:",
+        *distribution_lines(platform_dist),
+        "="*60,
+        "",
+    ]
+    print("\n".join(lines))
 
 
 @click.command()
@@ -239,9 +531,9 @@ def main(num_events, bucket, local_only, output, historical_days, validate_only)
 
         # Read events from file
         events = []
-        with open(output, 'r') as f:
+        with open(output, 'rb') as f:
             for line in f:
-                events.append(json.loads(line.strip()))
+                events.append(loads(line.strip()))
 
         # Validate
         valid, invalid, errors = MMPEventValidator.validate_batch(events)
@@ -261,8 +553,9 @@ def main(num_events, bucket, local_only, output, historical_days, validate_only)
     print("MOBILE MEASUREMENT EVENT GENERATOR")
     print("="*60 + "\n")
 
-    # Generate events
-    events = generate_batch(num_events, historical_days)
+    # Generate events as a columnar batch; validation, summary and
+    # serialization below all work on it without building a list of dicts
+    events = generate_batch_soa(num_events, historical_days)
 
     # Validate events
     print("\nValidating generated events...")
@@ -280,13 +573,13 @@ def main(num_events, bucket, local_only, output, historical_days, validate_only)
     print_event_summary(events)
 
     # Save local backup
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
     output_with_timestamp = output.replace('.jsonl', f'_{timestamp}.jsonl')
     save_local_backup(events, output_with_timestamp)
 
     # Upload to GCS (unless local-only mode)
     if not local_only:
-        bucket_name = bucket or config.bucket_name
+        bucket_name = bucket or get_config().bucket_name
 
         if not bucket_name:
             print("\n✗ Error: GCS bucket not specified")
@@ -298,10 +591,8 @@ def main(num_events, bucket, local_only, output, historical_days, validate_only)
         try:
             uploader = GCSUploader(bucket_name)
             blob_name = f"raw/mmp_events_{timestamp}.jsonl"
-            gcs_uri = uploader.upload_json_lines(events, blob_name)
+            gcs_uri, file_size = uploader.upload_events(events, blob_name)
 
-            # Get file size
-            file_size = uploader.get_blob_size(blob_name)
             file_size_kb = file_size / 1024
 
             print(f"✓ Upload complete!")
@@ -1,4 +1,5 @@
 """Mobile Measurement Partner (MMP) configuration and constants"""
+import itertools
 from typing import Dict, Tuple, List
 
 # Event type probabilities (realistic MMP funnel)
@@ -52,6 +53,25 @@ SAMPLE_CAMPAIGNS = [
 COUNTRY_CODES = ['US', 'CN', 'IN', 'BR', 'JP', 'DE', 'GB', 'FR', 'KR', 'CA']
 COUNTRY_WEIGHTS = [0.25, 0.15, 0.12, 0.10, 0.08, 0.07, 0.06, 0.05, 0.05, 0.07]
 
+def _cumulative_weights(population: List[str], weights: List[float]) -> List[float]:
+    """Build a cumulative weight table, checking it lines up with its population"""
+    if len(weights) != len(population):
+        raise ValueError(
+            f"The number of weights ({len(weights)}) does not match "
+            f"the population ({len(population)})"
+        )
+    return list(itertools.accumulate(weights))
+
+
+# Cumulative weight tables for inverse-CDF sampling, built once at import
+# so generators can bisect into them instead of re-normalizing weights per draw
+# (the same tables can be passed to random.choices as cum_weights)
+EVENT_TYPES = list(EVENT_PROBABILITIES.keys())
+EVENT_CUM = _cumulative_weights(EVENT_TYPES, list(EVENT_PROBABILITIES.values()))
+PARTNER_CUM = _cumulative_weights(PARTNERS, PARTNER_WEIGHTS)
+PLATFORM_CUM = _cumulative_weights(PLATFORMS, PLATFORM_WEIGHTS)
+COUNTRY_CUM = _cumulative_weights(COUNTRY_CODES, COUNTRY_WEIGHTS)
+
 
 def get_event_type_list() -> List[str]:
     """Get list of valid event types"""
@@ -1,24 +1,76 @@
 """Google Cloud Storage upload utilities with retry logic"""
-import json
+import functools
+import threading
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Tuple, Union
+from google import resumable_media
 from google.cloud import storage
 from google.api_core import retry
 from google.api_core import exceptions
 
+from src.generator.event_batch import EventBatch
+from src.utils.serialization import dumps
+
+# Resumable upload chunk size (must be a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Batches at or above this size are uploaded as parallel shards
+PARALLEL_UPLOAD_THRESHOLD = 50_000
+
+# GCS compose accepts at most 32 source objects per request
+MAX_COMPOSE_SOURCES = 32
+
+# Errors worth retrying. Streamed (BlobWriter) uploads surface HTTP failures as
+# resumable_media.InvalidResponse, which is not a GoogleAPIError subclass
+RETRYABLE_ERRORS = (exceptions.GoogleAPIError, resumable_media.InvalidResponse)
+
+# Shared storage client; credential lookup and session setup happen once per process
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _client() -> storage.Client:
+    """Return the process-wide storage client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = storage.Client()
+    return _CLIENT
+
+
+def _abort_writer(writer: Any) -> None:
+    """
+    Discard a failed streaming upload without finalizing it
+
+    BlobWriter.close() (also run by __exit__ and __del__) sends whatever is
+    buffered as the final chunk, which would either commit a truncated object
+    or fail again on a dead session and mask the original error. Closing only
+    the writer's internal buffer marks it closed so neither happens; the
+    unfinished resumable session expires server-side.
+    """
+    buffer = getattr(writer, '_buffer', None)
+    if buffer is not None:
+        buffer.close()
+
 
 class GCSUploader:
     """Upload data to Google Cloud Storage with error handling"""
 
     def __init__(self, bucket_name: str):
-        """Initialize GCS client and bucket"""
-        self.client = storage.Client()
+        """Initialize GCS client; the bucket handle is resolved on first use"""
+        self.client = _client()
         self.bucket_name = bucket_name
-        self.bucket = self.client.bucket(bucket_name)
+
+    @functools.cached_property
+    def bucket(self) -> storage.Bucket:
+        """Bucket handle bound to the shared client"""
+        return self.client.bucket(self.bucket_name)
 
     def upload_json_lines(
         self,
-        events: List[Dict[str, Any]],
+        events: Union[List[Dict[str, Any]], EventBatch],
         blob_name: str,
         max_retries: int = 3
     ) -> str:
@@ -26,31 +78,168 @@ class GCSUploader:
         Upload events as newline-delimited JSON (JSONL) to GCS
 
         Args:
-            events: List of event dictionaries
+            events: List of event dictionaries or an EventBatch
             blob_name: Target blob name (path in bucket)
             max_retries: Maximum number of upload retries
 
         Returns:
             GCS URI of uploaded file
         """
-        # Convert events to JSONL format
-        jsonl_content = "\n".join([json.dumps(event) for event in events])
+        return self._upload_stream(events, blob_name, max_retries)[0]
+
+    def upload_json_lines_parallel(
+        self,
+        events: Union[List[Dict[str, Any]], EventBatch],
+        blob_name: str,
+        shards: int = 8,
+        max_retries: int = 3
+    ) -> str:
+        """
+        Upload events as JSONL by serializing and uploading shards concurrently
+
+        Events are split into contiguous shards, each shard is serialized and
+        uploaded as a temporary part object from a worker thread, and the parts
+        are composed server-side into a single object. Intended for large
+        batches (see PARALLEL_UPLOAD_THRESHOLD).
+
+        Args:
+            events: List of event dictionaries or an EventBatch
+            blob_name: Target blob name (path in bucket)
+            shards: Number of parallel shards (capped at MAX_COMPOSE_SOURCES)
+            max_retries: Maximum number of upload retries per shard
+
+        Returns:
+            GCS URI of uploaded file
+        """
+        return self._upload_sharded(events, blob_name, shards, max_retries)[0]
 
+    def upload_events(
+        self,
+        events: Union[List[Dict[str, Any]], EventBatch],
+        blob_name: str,
+        max_retries: int = 3
+    ) -> Tuple[str, int]:
+        """
+        Upload events as JSONL, sharding batches of PARALLEL_UPLOAD_THRESHOLD or more
+
+        The uploaded size is counted while serializing, so no metadata request
+        is needed afterwards.
+
+        Args:
+            events: List of event dictionaries or an EventBatch
+            blob_name: Target blob name (path in bucket)
+            max_retries: Maximum number of upload retries
+
+        Returns:
+            Tuple of (GCS URI of uploaded file, uploaded size in bytes)
+        """
+        if len(events) >= PARALLEL_UPLOAD_THRESHOLD:
+            return self._upload_sharded(events, blob_name, max_retries=max_retries)
+        return self._upload_stream(events, blob_name, max_retries)
+
+    def _upload_stream(
+        self,
+        events: Union[List[Dict[str, Any]], EventBatch],
+        blob_name: str,
+        max_retries: int
+    ) -> Tuple[str, int]:
+        """Stream events to a single blob; returns (GCS URI, bytes written)"""
         # Create blob
         blob = self.bucket.blob(blob_name)
 
-        # Upload with retry logic
+        # Stream events as JSONL. Each event is serialized straight into the
+        # resumable upload, so the full file is never held in memory and
+        # chunks go out while later events are serialized. The writer is not
+        # used as a context manager: on failure it must be aborted, not closed.
+        def upload():
+            writer = blob.open(
+                'wb',
+                content_type='application/jsonl',
+                chunk_size=UPLOAD_CHUNK_SIZE
+            )
+            try:
+                for event in events:
+                    writer.write(dumps(event))
+                    writer.write(b"\n")
+                size = writer.tell()
+                writer.close()
+            except BaseException:
+                _abort_writer(writer)
+                raise
+            return size
+
+        size = self._upload_with_retry(upload, max_retries)
+        gcs_uri = f"gs://{self.bucket_name}/{blob_name}"
+        print(f"✓ Successfully uploaded to {gcs_uri}")
+        return gcs_uri, size
+
+    def _upload_sharded(
+        self,
+        events: Union[List[Dict[str, Any]], EventBatch],
+        blob_name: str,
+        shards: int = 8,
+        max_retries: int = 3
+    ) -> Tuple[str, int]:
+        """Upload events as composed shards; returns (GCS URI, total bytes uploaded)"""
+        shards = max(1, min(shards, MAX_COMPOSE_SOURCES, len(events)))
+        if shards == 1:
+            return self._upload_stream(events, blob_name, max_retries)
+
+        # Split into exactly `shards` contiguous chunks whose sizes differ by at most one
+        base, extra = divmod(len(events), shards)
+        bounds = [i * base + min(i, extra) for i in range(shards + 1)]
+        chunks = [events[bounds[i]:bounds[i + 1]] for i in range(shards)]
+        part_blobs = [self.bucket.blob(f"{blob_name}.part{i}") for i in range(len(chunks))]
+
+        def upload_shard(part_blob, chunk):
+            payload = b"".join(dumps(event) + b"\n" for event in chunk)
+            self._upload_with_retry(
+                lambda: part_blob.upload_from_string(
+                    payload,
+                    content_type='application/jsonl',
+                    client=self.client
+                ),
+                max_retries
+            )
+            return len(payload)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                # list() re-raises the first shard failure, if any
+                shard_sizes = list(executor.map(upload_shard, part_blobs, chunks))
+
+            destination = self.bucket.blob(blob_name)
+            destination.content_type = 'application/jsonl'
+            self._upload_with_retry(lambda: destination.compose(part_blobs, client=self.client), max_retries)
+        finally:
+            self._delete_parts(part_blobs)
+
+        gcs_uri = f"gs://{self.bucket_name}/{blob_name}"
+        print(f"✓ Successfully uploaded to {gcs_uri} ({len(chunks)} shards)")
+        return gcs_uri, sum(shard_sizes)
+
+    def _delete_parts(self, part_blobs: List[storage.Blob]) -> None:
+        """
+        Remove temporary compose parts without masking the upload's outcome
+
+        Parts that were never created are ignored. Any other delete error is
+        reported as a warning instead of raised, so a shard or compose failure
+        stays the exception that propagates.
+        """
+        try:
+            self.bucket.delete_blobs(part_blobs, on_error=lambda blob: None, client=self.client)
+        except Exception as e:
+            names = ', '.join(blob.name for blob in part_blobs)
+            print(f"Warning: failed to delete temporary parts ({names}): {e}")
+
+    @staticmethod
+    def _upload_with_retry(upload: Callable[[], Any], max_retries: int) -> Any:
+        """Run an upload callable, retrying GCS API errors with exponential backoff"""
         for attempt in range(max_retries):
             try:
-                blob.upload_from_string(
-                    jsonl_content,
-                    content_type='application/jsonl'
-                )
-                gcs_uri = f"gs://{self.bucket_name}/{blob_name}"
-                print(f"✓ Successfully uploaded to {gcs_uri}")
-                return gcs_uri
-
-            except exceptions.GoogleAPIError as e:
+                return upload()
+
+            except RETRYABLE_ERRORS as e:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff
                     print(f"Upload failed (attempt {attempt + 1}/{max_retries}). Retrying in {wait_time}s...")
@@ -66,10 +255,11 @@ class GCSUploader:
     def blob_exists(self, blob_name: str) -> bool:
         """Check if blob exists in bucket"""
         blob = self.bucket.blob(blob_name)
-        return blob.exists()
+        return blob.exists(client=self.client)
 
     def get_blob_size(self, blob_name: str) -> int:
-        """Get blob size in bytes"""
-        blob = self.bucket.blob(blob_name)
-        blob.reload()
+        """Get blob size in bytes with a single metadata request"""
+        blob = self.bucket.get_blob(blob_name, client=self.client)
+        if blob is None:
+            raise exceptions.NotFound(f"Blob not found: {blob_name}")
         return blob.size
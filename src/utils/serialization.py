@@ -0,0 +1,21 @@
+"""JSON serialization helpers backed by orjson, with a stdlib fallback"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(data: Any) -> Any:
+        """Deserialize JSON from bytes or str"""
+        return json.loads(data)
@@ -1,6 +1,10 @@
 """Data validation utilities for MMP events"""
-from typing import Dict, Any, List, Tuple
-from datetime import datetime
+import re
+from typing import Dict, Any, List, Tuple, Union
+
+import numpy as np
+
+from src.generator.event_batch import EventBatch
 
 
 class MMPEventValidator:
@@ -18,8 +22,13 @@ class MMPEventValidator:
         'country_code'
     ]
 
-    VALID_EVENT_TYPES = ['install', 'reinstall', 'click', 'impression']
-    VALID_PLATFORMS = ['iOS', 'Android']
+    REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+
+    VALID_EVENT_TYPES = frozenset({'install', 'reinstall', 'click', 'impression'})
+    VALID_PLATFORMS = frozenset({'iOS', 'Android'})
+
+    # ISO 8601 UTC timestamp as produced by the generator (YYYY-MM-DDTHH:MM:SSZ)
+    _TS_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z', re.ASCII)
 
     @staticmethod
     def validate_event(event: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -33,27 +42,31 @@ class MMPEventValidator:
             Tuple of (is_valid, list of error messages)
         """
         errors = []
+        valid_event_types = MMPEventValidator.VALID_EVENT_TYPES
+        valid_platforms = MMPEventValidator.VALID_PLATFORMS
 
         # Check required fields
-        for field in MMPEventValidator.REQUIRED_FIELDS:
-            if field not in event:
-                errors.append(f"Missing required field: {field}")
-
-        if errors:
+        missing = MMPEventValidator.REQUIRED_SET - event.keys()
+        if missing:
+            for field in MMPEventValidator.REQUIRED_FIELDS:
+                if field in missing:
+                    errors.append(f"Missing required field: {field}")
             return False, errors
 
         # Validate event_type
-        if event['event_type'] not in MMPEventValidator.VALID_EVENT_TYPES:
+        event_type = event['event_type']
+        if event_type not in valid_event_types:
             errors.append(
-                f"Invalid event_type: {event['event_type']}. "
-                f"Must be one of {MMPEventValidator.VALID_EVENT_TYPES}"
+                f"Invalid event_type: {event_type}. "
+                f"Must be one of {sorted(valid_event_types)}"
             )
 
         # Validate platform
-        if event['platform'] not in MMPEventValidator.VALID_PLATFORMS:
+        platform = event['platform']
+        if platform not in valid_platforms:
             errors.append(
-                f"Invalid platform: {event['platform']}. "
-                f"Must be one of {MMPEventValidator.VALID_PLATFORMS}"
+                f"Invalid platform: {platform}. "
+                f"Must be one of {sorted(valid_platforms)}"
             )
 
         # Validate cost (must be non-negative)
@@ -65,10 +78,9 @@ class MMPEventValidator:
             errors.append(f"Invalid cost_usd value: {event['cost_usd']}")
 
         # Validate timestamp format (ISO 8601)
-        try:
-            datetime.fromisoformat(event['timestamp'].replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            errors.append(f"Invalid timestamp format: {event['timestamp']}")
+        timestamp = event['timestamp']
+        if not isinstance(timestamp, str) or not MMPEventValidator._TS_RE.fullmatch(timestamp):
+            errors.append(f"Invalid timestamp format: {timestamp}")
 
         # Validate event_id (non-empty string)
         if not isinstance(event['event_id'], str) or not event['event_id']:
@@ -77,16 +89,25 @@ class MMPEventValidator:
         return len(errors) == 0, errors
 
     @staticmethod
-    def validate_batch(events: List[Dict[str, Any]]) -> Tuple[int, int, List[str]]:
+    def validate_batch(
+        events: Union[List[Dict[str, Any]], Dict[str, np.ndarray], EventBatch]
+    ) -> Tuple[int, int, List[str]]:
         """
         Validate a batch of events
 
         Args:
-            events: List of event dictionaries
+            events: List of event dictionaries, or columnar data (a dictionary
+                of field arrays or an EventBatch), which is dispatched to
+                validate_batch_arrays
 
         Returns:
             Tuple of (valid_count, invalid_count, list of error summaries)
         """
+        if isinstance(events, dict):
+            return MMPEventValidator.validate_batch_arrays(events)
+        if isinstance(events, EventBatch):
+            return MMPEventValidator.validate_batch_arrays(events.columns())
+
         valid_count = 0
         invalid_count = 0
         error_summaries = []
@@ -102,8 +123,57 @@ class MMPEventValidator:
         return valid_count, invalid_count, error_summaries
 
     @staticmethod
-    def get_event_distribution(events: List[Dict[str, Any]]) -> Dict[str, int]:
+    def validate_batch_arrays(columns: Dict[str, np.ndarray]) -> Tuple[int, int, List[str]]:
+        """
+        Validate a batch of events stored as one array per field
+
+        Each rule is evaluated as a mask over the whole batch, and only the
+        rows that fail a mask are re-checked with validate_event to build
+        error messages. Columns that are missing or not of the expected
+        string/numeric dtype fall back to row-by-row validation.
+
+        Args:
+            columns: Dictionary mapping field name to an array of values
+
+        Returns:
+            Tuple of (valid_count, invalid_count, list of error summaries)
+        """
+        arrays = {name: np.asarray(column) for name, column in columns.items()}
+
+        string_fields = ('event_id', 'timestamp', 'event_type', 'platform')
+        if (
+            not MMPEventValidator.REQUIRED_SET.issubset(arrays)
+            or any(arrays[field].dtype.kind != 'U' for field in string_fields)
+            or arrays['cost_usd'].dtype.kind not in 'iuf'
+        ):
+            return MMPEventValidator.validate_batch(_rows(arrays))
+
+        valid_mask = (
+            np.isin(arrays['event_type'], list(MMPEventValidator.VALID_EVENT_TYPES))
+            & np.isin(arrays['platform'], list(MMPEventValidator.VALID_PLATFORMS))
+            & ~(arrays['cost_usd'] < 0)
+            & _timestamp_mask(arrays['timestamp'])
+            & (np.char.str_len(arrays['event_id']) > 0)
+        )
+
+        # Build error messages only for the (usually few) failing rows
+        invalid_count = 0
+        error_summaries = []
+        for idx in np.flatnonzero(~valid_mask).tolist():
+            event = {name: array[idx].item() for name, array in arrays.items()}
+            is_valid, errors = MMPEventValidator.validate_event(event)
+            if not is_valid:
+                invalid_count += 1
+                error_summaries.append(f"Event {idx}: {'; '.join(errors)}")
+
+        return len(valid_mask) - invalid_count, invalid_count, error_summaries
+
+    @staticmethod
+    def get_event_distribution(events: Union[List[Dict[str, Any]], EventBatch]) -> Dict[str, int]:
         """Get distribution of event types"""
+        if isinstance(events, EventBatch):
+            return events.value_counts('event_type')
+
         distribution = {}
         for event in events:
             event_type = event.get('event_type', 'unknown')
@@ -111,6 +181,39 @@ class MMPEventValidator:
         return distribution
 
     @staticmethod
-    def calculate_total_cost(events: List[Dict[str, Any]]) -> float:
+    def calculate_total_cost(events: Union[List[Dict[str, Any]], EventBatch]) -> float:
         """Calculate total cost across all events"""
+        if isinstance(events, EventBatch):
+            return events.total_cost()
         return sum(float(event.get('cost_usd', 0)) for event in events)
+
+
+# Character layout of YYYY-MM-DDTHH:MM:SSZ, used by the vectorized timestamp check
+_TS_LENGTH = 20
+_TS_DIGIT_POS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_TS_SEP_POS = [4, 7, 10, 13, 16, 19]
+_TS_SEP_CODES = np.array([ord(c) for c in '--T::Z'], dtype=np.uint32)
+
+
+def _timestamp_mask(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of MMPEventValidator._TS_RE over a string array
+
+    Strings are viewed as fixed-width UTF-32 code points, so every digit
+    and separator position is checked with a few array comparisons instead
+    of one regex call per event.
+    """
+    ok = np.char.str_len(timestamps) == _TS_LENGTH
+    # Longer strings are truncated here, but have already failed the length check
+    codes = timestamps.astype(f'U{_TS_LENGTH}').view(np.uint32).reshape(-1, _TS_LENGTH)
+    digits = codes[:, _TS_DIGIT_POS]
+    ok &= ((digits >= ord('0')) & (digits <= ord('9'))).all(axis=1)
+    ok &= (codes[:, _TS_SEP_POS] == _TS_SEP_CODES).all(axis=1)
+    return ok
+
+
+def _rows(arrays: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Expand a dictionary of field arrays into a list of event dictionaries"""
+    keys = list(arrays.keys())
+    values = [array.tolist() for array in arrays.values()]
+    return [dict(zip(keys, row)) for row in zip(*values)]
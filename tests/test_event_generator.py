@@ -1,4 +1,8 @@
 """Unit tests for MMP event generator"""
+import json
+import subprocess
+from datetime import datetime, timedelta, timezone
+import numpy as np
 import pytest
 import sys
 import os
@@ -6,9 +10,21 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.generator.event_generator import generate_event, generate_batch
-from src.generator import mmp_config
+from src.generator.event_generator import (
+    generate_event,
+    generate_batch,
+    generate_batch_vectorized,
+    generate_columns,
+    generate_columns_parallel,
+    generate_batch_soa,
+    print_event_summary,
+    save_local_backup,
+)
+from src.generator import event_generator
+from src.generator.event_batch import EventBatch
+from src.generator import mmp_config, _fast
 from src.utils.validation import MMPEventValidator
+from src import config as config_module
 
 
 class TestEventGeneration:
@@ -44,6 +60,15 @@ class TestEventGeneration:
         event = generate_event()
         assert event['platform'] in mmp_config.get_platform_list()
 
+    def test_timestamp_within_window(self):
+        """Test that timestamps are UTC ISO 8601 within the historical window"""
+        now = datetime.now(timezone.utc)
+        event = generate_event(historical_days=2)
+        event_time = datetime.strptime(event['timestamp'], '%Y-%m-%dT%H:%M:%SZ')
+        event_time = event_time.replace(tzinfo=timezone.utc)
+
+        assert now - timedelta(days=2, seconds=1) <= event_time <= now + timedelta(seconds=1)
+
     def test_cost_is_positive(self):
         """Test that cost is non-negative"""
         event = generate_event()
@@ -91,6 +116,138 @@ class TestEventGeneration:
         assert len(events) == num_events
         assert all(isinstance(e, dict) for e in events)
 
+    def test_vectorized_batch_generation(self):
+        """Test vectorized batch generation matches the event schema"""
+        events = generate_batch_vectorized(500)
+
+        assert len(events) == 500
+        assert all(set(e) == set(MMPEventValidator.REQUIRED_FIELDS) for e in events)
+
+        for event in events:
+            min_cost, max_cost = mmp_config.COST_RANGES[event['event_type']]
+            assert round(min_cost, 2) <= event['cost_usd'] <= round(max_cost, 2)
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(events)
+        assert valid == 500
+        assert invalid == 0
+
+    def test_vectorized_batch_seed(self):
+        """Test that a seed makes vectorized sampling reproducible"""
+        first = generate_batch_vectorized(50, seed=42)
+        second = generate_batch_vectorized(50, seed=42)
+
+        assert [e['event_type'] for e in first] == [e['event_type'] for e in second]
+        assert [e['cost_usd'] for e in first] == [e['cost_usd'] for e in second]
+
+    def test_parallel_column_generation(self, monkeypatch):
+        """Test multi-process generation with independent, reproducible streams"""
+        monkeypatch.setattr(event_generator, 'PARALLEL_GENERATION_THRESHOLD', 0)
+
+        first = generate_columns_parallel(101, seed=11, workers=2)
+        second = generate_columns_parallel(101, seed=11, workers=2)
+
+        assert len(first['event_id']) == 101
+        assert first['event_type'].tolist() == second['event_type'].tolist()
+        assert len(set(first['event_id'].tolist())) == 101
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(first)
+        assert (valid, invalid) == (101, 0)
+
+    def test_parallel_workers_capped_by_batch_size(self, monkeypatch, capsys):
+        """Test each worker gets at least PARALLEL_GENERATION_THRESHOLD events"""
+        monkeypatch.setattr(event_generator, 'PARALLEL_GENERATION_THRESHOLD', 50)
+
+        columns = generate_columns_parallel(120, seed=11, workers=8)
+        assert len(columns['event_id']) == 120
+        assert '(2 workers)' in capsys.readouterr().out
+
+        generate_columns_parallel(99, seed=11, workers=8)
+        assert 'workers' not in capsys.readouterr().out
+
+    def test_cumulative_weight_tables(self):
+        """Test cumulative tables match random.choices cum_weights semantics"""
+        tables = [
+            (mmp_config.EVENT_TYPES, mmp_config.EVENT_CUM),
+            (mmp_config.PARTNERS, mmp_config.PARTNER_CUM),
+            (mmp_config.PLATFORMS, mmp_config.PLATFORM_CUM),
+            (mmp_config.COUNTRY_CODES, mmp_config.COUNTRY_CUM),
+        ]
+        for population, cum in tables:
+            assert len(cum) == len(population)
+            assert cum == sorted(cum)
+            assert cum[-1] == pytest.approx(1.0)
+
+        with pytest.raises(ValueError):
+            mmp_config._cumulative_weights(['a', 'b'], [1.0])
+
+    def test_fast_draw_columns(self):
+        """Test the sampling kernel returns in-range indices and costs"""
+        lo = np.array([mmp_config.COST_RANGES[et][0] for et in mmp_config.EVENT_TYPES])
+        hi = np.array([mmp_config.COST_RANGES[et][1] for et in mmp_config.EVENT_TYPES])
+        et_idx, pt_idx, pl_idx, co_idx, costs = _fast.draw_columns(
+            np.random.default_rng(0).random((5, 1000)),
+            np.array(mmp_config.EVENT_CUM), np.array(mmp_config.PARTNER_CUM),
+            np.array(mmp_config.PLATFORM_CUM), np.array(mmp_config.COUNTRY_CUM),
+            lo, hi
+        )
+
+        assert et_idx.max() < len(mmp_config.EVENT_TYPES)
+        assert pt_idx.max() < len(mmp_config.PARTNERS)
+        assert pl_idx.max() < len(mmp_config.PLATFORMS)
+        assert co_idx.max() < len(mmp_config.COUNTRY_CODES)
+        assert np.all((costs >= lo[et_idx]) & (costs <= hi[et_idx]))
+
+    @pytest.mark.skipif(not _fast.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_seeded_columns_match_across_backends(self, monkeypatch):
+        """Test a seed yields the same batch with and without the Numba kernel"""
+        monkeypatch.setattr(event_generator, 'NUMBA_MIN_EVENTS', 0)
+        compiled = generate_columns(500, seed=5)
+        monkeypatch.setattr(_fast, 'NUMBA_AVAILABLE', False)
+        fallback = generate_columns(500, seed=5)
+
+        for name in ('event_type', 'partner', 'platform', 'country_code',
+                     'cost_usd', 'app_id', 'campaign_id'):
+            assert compiled[name].tolist() == fallback[name].tolist()
+
+    def test_local_backup_round_trip(self, tmp_path):
+        """Test that the local backup is valid JSONL"""
+        events = generate_batch(25)
+        output_file = tmp_path / 'raw' / 'events.jsonl'
+        save_local_backup(events, str(output_file))
+
+        with open(output_file) as f:
+            lines = f.read().splitlines()
+
+        assert [json.loads(line) for line in lines] == events
+
+    def test_local_backup_respects_umask(self, tmp_path):
+        """Test the backup is created with open()'s default 0o666 & ~umask mode"""
+        umask = os.umask(0o002)
+        try:
+            output_file = tmp_path / 'events.jsonl'
+            save_local_backup(generate_batch(2), str(output_file))
+        finally:
+            os.umask(umask)
+
+        assert output_file.stat().st_mode & 0o777 == 0o664
+
+    def test_print_event_summary(self, capsys):
+        """Test summary output lists sorted distributions and totals"""
+        events = [
+            {'event_type': 'install', 'partner': 'Branch', 'platform': 'iOS', 'cost_usd': 5.00},
+            {'event_type': 'click', 'partner': 'Adjust', 'platform': 'iOS', 'cost_usd': 0.25},
+            {'event_type': 'install', 'partner': 'Adjust', 'platform': 'Android', 'cost_usd': 2.75},
+            {'event_type': 'impression', 'partner': 'Adjust', 'platform': 'Android', 'cost_usd': 0.00},
+        ]
+        print_event_summary(events)
+        output = capsys.readouterr().out
+
+        assert "Total Events: 4" in output
+        assert "Total Cost: $8.00" in output
+        assert "  install     :   2 events ( 50.0%)" in output
+        assert output.index("  Adjust") < output.index("  Branch")
+        assert output.index("  Android") < output.index("  iOS")
+
     def test_event_validation_pass(self):
         """Test that generated events pass validation"""
         event = generate_event()
@@ -109,6 +266,46 @@ class TestEventGeneration:
         assert len(errors) == 0
 
 
+class TestEventBatch:
+    """Test columnar event batch functionality"""
+
+    def test_batch_matches_event_schema(self):
+        """Test that iterating a batch yields valid event dictionaries"""
+        batch = generate_batch_soa(100, seed=3)
+        events = batch.to_events()
+
+        assert isinstance(batch, EventBatch)
+        assert len(batch) == len(events) == 100
+        assert list(events[0].keys()) == MMPEventValidator.REQUIRED_FIELDS
+        assert batch[0] == events[0]
+        assert isinstance(events[0]['cost_usd'], float)
+
+    def test_batch_slicing(self):
+        """Test that slicing returns a smaller batch over the same rows"""
+        batch = generate_batch_soa(30, seed=3)
+        part = batch[10:20]
+
+        assert isinstance(part, EventBatch)
+        assert part.to_events() == batch.to_events()[10:20]
+
+    def test_batch_aggregations(self):
+        """Test columnar aggregations agree with the list-based helpers"""
+        batch = generate_batch_soa(500, seed=3)
+        events = batch.to_events()
+
+        assert batch.value_counts('event_type') == MMPEventValidator.get_event_distribution(events)
+        assert MMPEventValidator.get_event_distribution(batch) == batch.value_counts('event_type')
+        assert batch.total_cost() == pytest.approx(MMPEventValidator.calculate_total_cost(events))
+        assert MMPEventValidator.calculate_total_cost(batch) == pytest.approx(batch.total_cost())
+
+    def test_batch_validation(self):
+        """Test that validate_batch accepts an EventBatch"""
+        batch = generate_batch_soa(50, seed=3)
+        valid, invalid, errors = MMPEventValidator.validate_batch(batch)
+
+        assert (valid, invalid, errors) == (50, 0, [])
+
+
 class TestEventValidator:
     """Test event validation functionality"""
 
@@ -184,6 +381,72 @@ class TestEventValidator:
         assert not is_valid
         assert any('cost' in error.lower() for error in errors)
 
+    def test_validate_invalid_timestamp(self):
+        """Test validation fails for malformed timestamps"""
+        event = {
+            'event_id': 'test-123',
+            'timestamp': '2026-02-12 14:30:00',  # Missing T separator and Z
+            'event_type': 'install',
+            'partner': 'Adjust',
+            'cost_usd': 5.50,
+            'app_id': 'com.test.app',
+            'campaign_id': 'campaign_001',
+            'platform': 'iOS',
+            'country_code': 'US'
+        }
+
+        is_valid, errors = MMPEventValidator.validate_event(event)
+        assert not is_valid
+        assert any('timestamp' in error for error in errors)
+
+        event['timestamp'] = None
+        is_valid, errors = MMPEventValidator.validate_event(event)
+        assert not is_valid
+
+    def test_validate_batch_arrays(self):
+        """Test columnar validation agrees with row-by-row validation"""
+        columns = generate_columns(200, seed=7)
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(columns)
+        assert (valid, invalid, errors) == (200, 0, [])
+
+        columns['event_type'] = columns['event_type'].copy()
+        columns['event_type'][3] = 'invalid_type'
+        columns['cost_usd'] = columns['cost_usd'].copy()
+        columns['cost_usd'][5] = -1.0
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(columns)
+        assert valid == 198
+        assert invalid == 2
+        assert errors[0].startswith('Event 3:') and 'event_type' in errors[0]
+        assert errors[1].startswith('Event 5:') and 'Cost' in errors[1]
+
+    def test_validate_batch_arrays_timestamps(self):
+        """Test columnar timestamp checks agree with the scalar validator"""
+        bad_timestamps = [
+            '2026-02-12 14:30:00Z',
+            '2026-02-12T14:30:00',
+            '2026-02-12T14:30:00+00:00',
+            'abcd-ef-ghTij:kl:mnZ',
+        ]
+        columns = generate_columns(len(bad_timestamps) + 1, seed=7)
+        columns['timestamp'] = np.array(bad_timestamps + ['2026-02-12T14:30:00Z'])
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(columns)
+        assert valid == 1
+        assert invalid == len(bad_timestamps)
+        assert all('timestamp' in error for error in errors)
+
+    def test_validate_batch_arrays_missing_column(self):
+        """Test columnar validation reports missing fields per event"""
+        columns = generate_columns(3, seed=7)
+        del columns['partner']
+
+        valid, invalid, errors = MMPEventValidator.validate_batch(columns)
+        assert valid == 0
+        assert invalid == 3
+        assert all('partner' in error for error in errors)
+
     def test_get_event_distribution(self):
         """Test event distribution calculation"""
         events = [
@@ -211,5 +474,95 @@ class TestEventValidator:
         assert total_cost == 9.75
 
 
+class TestConfig:
+    """Test .env loading and lazy configuration"""
+
+    @pytest.fixture
+    def environ(self, monkeypatch):
+        """Isolated copy of the environment for loader tests"""
+        env = {}
+        monkeypatch.setattr(os, 'environ', env)
+        return env
+
+    def write_env(self, tmp_path, text):
+        env_file = tmp_path / '.env'
+        env_file.write_text(text)
+        return env_file
+
+    def loaded(self, environ):
+        """Environment without the variable pytest sets for each test"""
+        return {k: v for k, v in environ.items() if k != 'PYTEST_CURRENT_TEST'}
+
+    def test_comments_and_export_prefix(self, tmp_path, environ):
+        """Test comment lines are skipped and the export prefix is stripped"""
+        env_file = self.write_env(tmp_path, (
+            "# GCP Configuration\n"
+            "\n"
+            "GCP_PROJECT_ID=my-project\n"
+            "export GCS_BUCKET=my-bucket\n"
+            "#BQ_DATASET=commented_out\n"
+        ))
+        config_module._load_env_fast(env_file)
+
+        assert self.loaded(environ) == {'GCP_PROJECT_ID': 'my-project', 'GCS_BUCKET': 'my-bucket'}
+
+    def test_quotes_inline_comments_and_missing_equals(self, tmp_path, environ):
+        """Test quoting, inline comments and malformed lines match python-dotenv"""
+        env_file = self.write_env(tmp_path, (
+            'DOUBLE="a\\nb"\n'
+            "SINGLE='a\\nb'\n"
+            'QUOTED_HASH="x # y"  # trailing comment\n'
+            'UNQUOTED=plain # trailing comment\n'
+            'NO_SPACE_HASH=plain#kept\n'
+            'WINDOWS_PATH=C:\\path\\key.json\n'
+            'NOT_A_PAIR\n'
+        ))
+        config_module._load_env_fast(env_file)
+
+        assert self.loaded(environ) == {
+            'DOUBLE': 'a\nb',
+            'SINGLE': 'a\\nb',
+            'QUOTED_HASH': 'x # y',
+            'UNQUOTED': 'plain',
+            'NO_SPACE_HASH': 'plain#kept',
+            'WINDOWS_PATH': 'C:\\path\\key.json',
+        }
+
+    def test_existing_environment_wins(self, tmp_path, environ):
+        """Test variables already in the environment are not overridden"""
+        environ['GCS_BUCKET'] = 'from-environment'
+        env_file = self.write_env(tmp_path, "GCS_BUCKET=from-dotenv\nBQ_DATASET=ds\n")
+        config_module._load_env_fast(env_file)
+
+        assert self.loaded(environ) == {'GCS_BUCKET': 'from-environment', 'BQ_DATASET': 'ds'}
+
+    def test_skip_dotenv(self, tmp_path, environ, monkeypatch):
+        """Test SKIP_DOTENV=1 leaves the environment untouched"""
+        env_file = self.write_env(tmp_path, "GCS_BUCKET=from-dotenv\n")
+        monkeypatch.setattr(config_module, '_find_env_file', lambda: env_file)
+
+        environ['SKIP_DOTENV'] = '1'
+        config_module.load_env()
+        assert 'GCS_BUCKET' not in environ
+
+        del environ['SKIP_DOTENV']
+        config_module.load_env()
+        assert environ['GCS_BUCKET'] == 'from-dotenv'
+
+    def test_config_import_is_lazy(self):
+        """Test importing modules does not build config until it is accessed"""
+        script = (
+            "import src.generator.event_generator, src.config as c\n"
+            "assert c.get_config.cache_info().currsize == 0\n"
+            "assert 'config' not in vars(c)\n"
+            "from src.config import config\n"
+            "assert config is c.get_config()\n"
+            "assert c.get_config.cache_info().currsize == 1\n"
+        )
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        env = dict(os.environ, SKIP_DOTENV='1')
+        subprocess.run([sys.executable, '-c', script], cwd=root, env=env, check=True)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
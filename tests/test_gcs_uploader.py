@@ -0,0 +1,213 @@
+"""Unit tests for GCS upload utilities (using in-memory fake blobs)"""
+import io
+import pytest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google import resumable_media
+
+from src.utils import gcs_uploader
+from src.utils.gcs_uploader import GCSUploader
+
+
+class FakeWriter:
+    """Stand-in for BlobWriter: buffers writes and commits them on close()"""
+
+    def __init__(self, blob, fail_after_writes=None):
+        self.blob = blob
+        self.fail_after_writes = fail_after_writes
+        self.writes = 0
+        self._buffer = io.BytesIO()
+
+    def write(self, data):
+        if self.fail_after_writes is not None and self.writes >= self.fail_after_writes:
+            raise resumable_media.InvalidResponse(mock.Mock(status_code=503), "Service unavailable")
+        self.writes += 1
+        return self._buffer.write(data)
+
+    def tell(self):
+        return self._buffer.tell()
+
+    def close(self):
+        if not self._buffer.closed:
+            self.blob.data = self._buffer.getvalue()
+            self.blob.finalized += 1
+            self._buffer.close()
+
+
+class FakeBlob:
+    """In-memory blob supporting streamed, string and compose uploads"""
+
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.data = None
+        self.finalized = 0
+        self.content_type = None
+        self.writers = []
+
+    def open(self, mode, **kwargs):
+        failures = self.bucket.stream_failures
+        writer = FakeWriter(self, fail_after_writes=failures.pop(0) if failures else None)
+        self.writers.append(writer)
+        return writer
+
+    def upload_from_string(self, payload, content_type=None, client=None):
+        if self.name in self.bucket.failing_blobs:
+            raise resumable_media.InvalidResponse(mock.Mock(status_code=500), "Shard failed")
+        self.data = payload
+
+    def compose(self, sources, client=None):
+        self.data = b"".join(source.data for source in sources)
+
+
+class FakeBucket:
+    """In-memory bucket that remembers every blob handed out"""
+
+    def __init__(self):
+        self.blobs = {}
+        self.deleted = []
+        self.stream_failures = []
+        self.failing_blobs = set()
+        self.delete_error = None
+
+    def blob(self, name):
+        if name not in self.blobs:
+            self.blobs[name] = FakeBlob(self, name)
+        return self.blobs[name]
+
+    def delete_blobs(self, blobs, on_error=None, client=None):
+        if self.delete_error is not None:
+            raise self.delete_error
+        self.deleted.extend(blob.name for blob in blobs)
+
+
+@pytest.fixture
+def bucket():
+    return FakeBucket()
+
+
+@pytest.fixture
+def uploader(bucket, monkeypatch):
+    monkeypatch.setattr(gcs_uploader, '_client', mock.Mock)
+    monkeypatch.setattr(gcs_uploader.time, 'sleep', mock.Mock())
+    uploader = GCSUploader('test-bucket')
+    uploader.__dict__['bucket'] = bucket  # Override the cached_property
+    return uploader
+
+
+def make_events(n):
+    return [{'event_id': f'id-{i}', 'cost_usd': i * 0.5} for i in range(n)]
+
+
+class TestStreamingUpload:
+    """Test single-stream JSONL uploads"""
+
+    def test_upload_writes_jsonl(self, uploader, bucket):
+        """Test streamed events arrive as newline-terminated JSON lines"""
+        gcs_uri = uploader.upload_json_lines(make_events(3), 'raw/events.jsonl')
+
+        data = bucket.blobs['raw/events.jsonl'].data
+        assert gcs_uri == 'gs://test-bucket/raw/events.jsonl'
+        assert data.count(b"\n") == 3 and data.endswith(b"\n")
+
+    def test_streamed_upload_retries(self, uploader, bucket):
+        """Test a mid-stream HTTP failure is retried and the failed writer is not finalized"""
+        bucket.stream_failures = [4]  # First attempt fails on its fifth write
+
+        uploader.upload_json_lines(make_events(5), 'raw/events.jsonl')
+
+        blob = bucket.blobs['raw/events.jsonl']
+        assert gcs_uploader.time.sleep.call_count == 1
+        assert len(blob.writers) == 2
+        assert blob.finalized == 1  # Only the successful attempt committed data
+        assert blob.writers[0]._buffer.closed
+        assert blob.data.count(b"\n") == 5
+
+    def test_streamed_upload_gives_up(self, uploader, bucket):
+        """Test the upload fails after max_retries streamed attempts"""
+        bucket.stream_failures = [0, 0, 0]
+
+        with pytest.raises(Exception, match='Failed to upload after 3 attempts'):
+            uploader.upload_json_lines(make_events(2), 'raw/events.jsonl')
+
+        assert gcs_uploader.time.sleep.call_count == 2
+        assert bucket.blobs['raw/events.jsonl'].finalized == 0
+
+
+class TestParallelUpload:
+    """Test sharded JSONL uploads composed into a single object"""
+
+    def test_shard_count_capped(self, uploader, bucket):
+        """Test the number of parts never exceeds MAX_COMPOSE_SOURCES"""
+        uploader.upload_json_lines_parallel(make_events(100), 'raw/events.jsonl', shards=50)
+
+        parts = [name for name in bucket.blobs if '.part' in name]
+        assert len(parts) == gcs_uploader.MAX_COMPOSE_SOURCES
+
+    def test_composed_output_matches_stream(self, uploader, bucket):
+        """Test composed shards are byte-identical to a single-stream upload"""
+        events = make_events(103)
+        uploader.upload_json_lines(events, 'raw/stream.jsonl')
+        uploader.upload_json_lines_parallel(events, 'raw/sharded.jsonl', shards=4)
+
+        assert bucket.blobs['raw/sharded.jsonl'].data == bucket.blobs['raw/stream.jsonl'].data
+        assert sorted(bucket.deleted) == sorted(f'raw/sharded.jsonl.part{i}' for i in range(4))
+
+    def test_parts_deleted_when_shard_fails(self, uploader, bucket):
+        """Test temporary parts are cleaned up after a shard upload fails"""
+        bucket.failing_blobs = {'raw/events.jsonl.part1'}
+
+        with pytest.raises(Exception, match='Failed to upload after 3 attempts'):
+            uploader.upload_json_lines_parallel(make_events(40), 'raw/events.jsonl', shards=4)
+
+        assert sorted(bucket.deleted) == sorted(f'raw/events.jsonl.part{i}' for i in range(4))
+        assert 'raw/events.jsonl' not in bucket.blobs  # Compose never ran
+
+    def test_cleanup_error_does_not_mask_failure(self, uploader, bucket):
+        """Test a failing delete leaves the shard failure as the raised error"""
+        bucket.failing_blobs = {'raw/events.jsonl.part0'}
+        bucket.delete_error = RuntimeError('delete failed')
+
+        with pytest.raises(Exception, match='Shard failed'):
+            uploader.upload_json_lines_parallel(make_events(40), 'raw/events.jsonl', shards=4)
+
+    def test_single_shard_falls_back_to_stream(self, uploader, bucket):
+        """Test tiny batches skip sharding and upload as one stream"""
+        gcs_uri = uploader.upload_json_lines_parallel(make_events(1), 'raw/events.jsonl')
+
+        assert gcs_uri == 'gs://test-bucket/raw/events.jsonl'
+        assert list(bucket.blobs) == ['raw/events.jsonl']
+
+
+class TestUploadSize:
+    """Test the (uri, size) results reported by upload_events"""
+
+    def test_stream_size_matches_uploaded_bytes(self, uploader, bucket):
+        """Test the streamed size equals the bytes the writer committed"""
+        gcs_uri, size = uploader.upload_events(make_events(7), 'raw/events.jsonl')
+
+        assert gcs_uri == 'gs://test-bucket/raw/events.jsonl'
+        assert list(bucket.blobs) == ['raw/events.jsonl']  # Below the sharding threshold
+        assert size == len(bucket.blobs['raw/events.jsonl'].data)
+
+    def test_streamed_size_after_retry(self, uploader, bucket):
+        """Test a retried stream reports only the successful attempt's bytes"""
+        bucket.stream_failures = [3]
+
+        _, size = uploader.upload_events(make_events(4), 'raw/events.jsonl')
+        assert size == len(bucket.blobs['raw/events.jsonl'].data)
+
+    def test_sharded_size_matches_composed_bytes(self, uploader, bucket, monkeypatch):
+        """Test the summed shard sizes equal the composed object's bytes"""
+        monkeypatch.setattr(gcs_uploader, 'PARALLEL_UPLOAD_THRESHOLD', 10)
+
+        gcs_uri, size = uploader.upload_events(make_events(57), 'raw/events.jsonl')
+
+        parts = [bucket.blobs[name].data for name in bucket.blobs if '.part' in name]
+        assert len(parts) == 8
+        assert size == sum(map(len, parts)) == len(bucket.blobs['raw/events.jsonl'].data)